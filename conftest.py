@@ -0,0 +1,8 @@
+"""
+Pytest configuration.
+
+Placing this file at the repository root puts the root on sys.path, so
+tests import the application as the ``src`` package (e.g. ``from
+src.services.data_gen import EmployeeDataGenerator``).
+
+"""
@@ -0,0 +1 @@
+"""Employee Data Generator application package."""
@@ -4,6 +4,8 @@ Employee Data Generator - Main Application Entry Point
 This is the main entry point for the Employee Data Generator desktop application.
 It initializes the PySide6 application, sets up logging, and launches the main window.
 
+Run from the repository root with: python -m src.main
+
 The application provides functionality to:
 - Generate synthetic employee data
 - Export data to Excel with summary statistics
@@ -13,10 +15,9 @@ The application provides functionality to:
 
 import sys
 import logging
-import os
 from PySide6.QtWidgets import QApplication
-from ui.main_window import MainWindow
-from utils.constants import LOG_FORMAT, LOG_LEVEL
+from .ui.main_window import MainWindow
+from .utils.constants import LOG_FORMAT, LOG_LEVEL
 
 
 def setup_logging():
@@ -0,0 +1 @@
+"""Data models for the Employee Data Generator."""
@@ -8,14 +8,22 @@ necessary fields for the Employee Data Generator application.
 The dataclass provides automatic generation of __init__, __repr__, and
 other special methods, making it ideal for data transfer objects.
 
+For bulk workflows the EmployeeTable class stores the same fields as
+column arrays (struct-of-arrays), so large batches never need one Python
+object per employee until a record is actually accessed.
+
 """
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, Any
+from typing import Iterator, List
+import numpy as np
+import pandas as pd
+
+from ..utils.constants import DEPARTMENTS, START_DATE, START_ORDINAL
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Employee:
     """
     Represents an employee record with all required fields.
@@ -39,9 +47,12 @@ class Employee:
         ...     salary=75000.50,
         ...     hire_date=date(2023, 1, 15)
         ... )
-        >>> emp.to_dict()
+        >>> dataclasses.asdict(emp)
         {'emp_id': 1, 'full_name': 'John Doe', 'department': 'IT',
          'salary': 75000.5, 'hire_date': datetime.date(2023, 1, 15)}
+
+    Instances are immutable and use __slots__, which keeps large
+    collections of employees compact.
     """
 
     emp_id: int
@@ -50,31 +61,6 @@ class Employee:
     salary: float
     hire_date: date
 
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        Convert employee data to dictionary format.
-
-        This method provides a clean dictionary representation of the
-        employee data, suitable for JSON serialization, DataFrame creation,
-        or other data processing operations.
-
-        Returns:
-            Dict[str, Any]: Dictionary containing all employee fields
-
-        Example:
-            >>> emp = Employee(1, "John Doe", "IT", 75000.50, date(2023, 1, 15))
-            >>> emp.to_dict()
-            {'emp_id': 1, 'full_name': 'John Doe', 'department': 'IT',
-             'salary': 75000.5, 'hire_date': datetime.date(2023, 1, 15)}
-        """
-        return {
-            'emp_id': self.emp_id,
-            'full_name': self.full_name,
-            'department': self.department,
-            'salary': self.salary,
-            'hire_date': self.hire_date
-        }
-
     def __str__(self) -> str:
         """
         Return a human-readable string representation.
@@ -101,4 +87,110 @@ class Employee:
             raise ValueError("Salary cannot be negative")
 
         if self.hire_date > date.today():
-            raise ValueError("Hire date cannot be in the future")
\ No newline at end of file
+            raise ValueError("Hire date cannot be in the future")
+
+
+@dataclass(eq=False)
+class EmployeeTable:
+    """
+    Columnar (struct-of-arrays) store for a batch of employees.
+
+    Each field is held as a single array instead of one Employee object
+    per row, which keeps bulk generation and DataFrame construction free
+    of per-row Python objects. Indexing or iterating the table yields
+    Employee objects built on demand, so it can be used wherever a list
+    of employees is expected.
+
+    Attributes:
+        emp_id (np.ndarray): Employee identifiers (int64)
+        names (List[str]): Employee full names
+        dept_idx (np.ndarray): Indices into DEPARTMENTS
+        salary (np.ndarray): Annual salaries (float64)
+        hire_date_offset (np.ndarray): Hire dates as int32 day offsets from
+            START_DATE; converted to dates only when records or DataFrames
+            are built
+    """
+
+    emp_id: np.ndarray
+    names: List[str]
+    dept_idx: np.ndarray
+    salary: np.ndarray
+    hire_date_offset: np.ndarray
+
+    def __post_init__(self):
+        """Store hire dates compactly as int32 day offsets."""
+        self.hire_date_offset = np.asarray(self.hire_date_offset, dtype=np.int32)
+
+    @property
+    def hire_date_array(self) -> pd.DatetimeIndex:
+        """
+        Hire dates for all rows, converted in one vectorized operation.
+
+        Returns:
+            pd.DatetimeIndex: Hire date of each employee
+        """
+        return pd.Timestamp(START_DATE) + pd.to_timedelta(self.hire_date_offset, unit='D')
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> Employee:
+        """
+        Build the Employee record stored at the given row.
+
+        Args:
+            index (int): Row position in the table
+
+        Returns:
+            Employee: Employee object for that row
+        """
+        return Employee(
+            emp_id=int(self.emp_id[index]),
+            full_name=self.names[index],
+            department=DEPARTMENTS[self.dept_idx[index]],
+            salary=float(self.salary[index]),
+            hire_date=date.fromordinal(START_ORDINAL + int(self.hire_date_offset[index]))
+        )
+
+    def __iter__(self) -> Iterator[Employee]:
+        """
+        Iterate over the table as Employee records.
+
+        Columns are converted to Python lists once up front, so iteration
+        does not index the NumPy arrays element by element.
+        """
+        departments = [DEPARTMENTS[idx] for idx in self.dept_idx.tolist()]
+        columns = zip(
+            self.emp_id.tolist(),
+            self.names,
+            departments,
+            self.salary.tolist(),
+            self.hire_date_offset.tolist()
+        )
+        for emp_id, name, department, salary, offset in columns:
+            yield Employee(
+                emp_id=emp_id,
+                full_name=name,
+                department=department,
+                salary=salary,
+                hire_date=date.fromordinal(START_ORDINAL + offset)
+            )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Convert the table to a pandas DataFrame in a single construction.
+
+        The department column is categorical, built directly from the
+        department indices without materializing per-row strings.
+
+        Returns:
+            pd.DataFrame: DataFrame with emp_id, full_name, department,
+            salary and hire_date columns
+        """
+        return pd.DataFrame({
+            'emp_id': self.emp_id,
+            'full_name': self.names,
+            'department': pd.Categorical.from_codes(self.dept_idx, categories=DEPARTMENTS),
+            'salary': self.salary,
+            'hire_date': self.hire_date_array
+        })
\ No newline at end of file
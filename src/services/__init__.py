@@ -0,0 +1 @@
+"""Business logic services: data generation and Excel export."""
@@ -10,21 +10,45 @@ Features:
 - Random salary generation within specified range
 - Random hire date generation within date range
 - Auto-incrementing employee IDs
+- Vectorized bulk generation of numeric fields using NumPy
 
 """
 
 import random
 import logging
-import sys
-import os
-from datetime import date, timedelta
+import threading
+from datetime import date
+from typing import Callable, Optional
+import numpy as np
 from faker import Faker
 
-# Add the parent directory to the path to enable relative imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ..models.employee import Employee, EmployeeTable
+from ..utils.constants import (
+    DEPARTMENTS, MIN_SALARY, MAX_SALARY, START_ORDINAL, DATE_SPAN_DAYS,
+    GENERATION_BATCH_SIZE
+)
 
-from models.employee import Employee
-from utils.constants import DEPARTMENTS, MIN_SALARY, MAX_SALARY, START_DATE, END_DATE
+
+def _gen_numeric_fields(rng: np.random.Generator, count: int, min_sal: float,
+                        max_sal: float, n_days: int, n_depts: int):
+    """
+    Generate the numeric employee fields as whole arrays.
+
+    Args:
+        rng (np.random.Generator): Generator to draw values from
+        count (int): Number of employees
+        min_sal (float): Minimum salary (inclusive)
+        max_sal (float): Maximum salary
+        n_days (int): Number of days in the hire date range
+        n_depts (int): Number of departments
+
+    Returns:
+        tuple: (salaries as float64, day offsets as int32, department indices as int32)
+    """
+    salaries = np.round(rng.uniform(min_sal, max_sal, count), 2)
+    offsets = rng.integers(0, n_days + 1, count, dtype=np.int32)
+    dept_idx = rng.integers(0, n_depts, count, dtype=np.int32)
+    return salaries, offsets, dept_idx
 
 
 class EmployeeDataGenerator:
@@ -37,13 +61,30 @@ class EmployeeDataGenerator:
 
     Attributes:
         fake (Faker): Faker instance for generating realistic names
+        _rng (random.Random): Per-generator PRNG for single-employee fields
+        _np_rng (np.random.Generator): NumPy generator for bulk numeric fields
     """
 
     def __init__(self):
-        """Initialize the data generator with Faker."""
+        """Initialize the data generator with Faker and its own random generators."""
         logging.info("Initializing EmployeeDataGenerator")
         self.fake = Faker()
+        self._rng = random.Random()
+        self._np_rng = np.random.default_rng()
     
+    def seed(self, seed: int) -> None:
+        """
+        Seed all random sources used by this generator.
+
+        Seeding makes subsequent output reproducible, e.g. for tests.
+
+        Args:
+            seed (int): Seed value
+        """
+        self._rng.seed(seed)
+        self._np_rng = np.random.default_rng(seed)
+        self.fake.seed_instance(seed)
+
     def generate_random_date(self) -> date:
         """
         Generate a random date between START_DATE and END_DATE.
@@ -51,13 +92,7 @@ class EmployeeDataGenerator:
         Returns:
             date: Random date within the specified range
         """
-        try:
-            days_between = (END_DATE - START_DATE).days
-            random_days = random.randint(0, days_between)
-            return START_DATE + timedelta(days=random_days)
-        except Exception as e:
-            logging.error(f"Error generating random date: {e}")
-            raise
+        return date.fromordinal(START_ORDINAL + self._rng.randrange(DATE_SPAN_DAYS + 1))
     
     def generate_employee(self, emp_id: int) -> Employee:
         """
@@ -69,34 +104,67 @@ class EmployeeDataGenerator:
         Returns:
             Employee: A new Employee object with generated data
         """
-        try:
-            employee = Employee(
-                emp_id=emp_id,
-                full_name=self.fake.name(),
-                department=random.choice(DEPARTMENTS),
-                salary=round(random.uniform(MIN_SALARY, MAX_SALARY), 2),
-                hire_date=self.generate_random_date()
-            )
-            
-            logging.debug(f"Generated employee: {employee.full_name} (ID: {emp_id})")
-            return employee
-            
-        except Exception as e:
-            logging.error(f"Error generating employee {emp_id}: {e}")
-            raise
+        return Employee(
+            emp_id=emp_id,
+            full_name=self.fake.name(),
+            department=self._rng.choice(DEPARTMENTS),
+            salary=round(self._rng.uniform(MIN_SALARY, MAX_SALARY), 2),
+            hire_date=date.fromordinal(START_ORDINAL + self._rng.randrange(DATE_SPAN_DAYS + 1))
+        )
     
-    def generate_employees(self, count: int) -> list[Employee]:
+    def generate_employees(self, count: int,
+                           progress_callback: Optional[Callable[[int], None]] = None,
+                           cancel_event: Optional[threading.Event] = None) -> Optional[EmployeeTable]:
         """
         Generate multiple employees.
+
+        Salaries, hire-date offsets and department indices are drawn as
+        whole arrays in one NumPy call each, instead of one Python-level
+        random call per employee, and are returned as a columnar table.
+        Hire-date offsets are sorted in place, so hire dates follow the
+        auto-incrementing employee IDs.
+
+        Names, the slow part, are generated in batches of
+        GENERATION_BATCH_SIZE with a progress report and a cancellation
+        check after each batch.
         
         Args:
             count (int): Number of employees to generate
+            progress_callback (callable, optional): Called with the number
+                of employees generated so far after each batch
+            cancel_event (threading.Event, optional): When set, generation
+                stops at the next batch boundary
             
         Returns:
-            list[Employee]: List of generated Employee objects
+            EmployeeTable: Table of generated employees; indexing or
+            iterating it yields Employee objects. None if cancelled.
         """
         try:
-            employees = [self.generate_employee(i + 1) for i in range(count)]
+            salaries, offsets, dept_idx = _gen_numeric_fields(
+                self._np_rng, count, MIN_SALARY, MAX_SALARY,
+                DATE_SPAN_DAYS, len(DEPARTMENTS)
+            )
+            # Ordered dividers: earlier IDs get earlier hire dates
+            offsets.sort()
+            # Resolve the Faker provider method once for the whole run
+            fake_name = self.fake.name
+            names = []
+            for start in range(0, count, GENERATION_BATCH_SIZE):
+                batch_size = min(GENERATION_BATCH_SIZE, count - start)
+                names.extend([fake_name() for _ in range(batch_size)])
+                if progress_callback:
+                    progress_callback(len(names))
+                if cancel_event is not None and cancel_event.is_set():
+                    logging.info(f"Generation cancelled after {len(names)} of {count} employees")
+                    return None
+
+            employees = EmployeeTable(
+                emp_id=np.arange(1, count + 1, dtype=np.int64),
+                names=names,
+                dept_idx=dept_idx,
+                salary=salaries,
+                hire_date_offset=offsets
+            )
             logging.info(f"Successfully generated {count} employees")
             return employees
             
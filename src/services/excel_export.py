@@ -14,16 +14,15 @@ Features:
 
 import logging
 import os
-import sys
 from datetime import datetime
-from typing import List
+from operator import attrgetter
+from typing import Callable, List, Optional, Union
 import pandas as pd
 
-# Add the parent directory to the path to enable relative imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ..models.employee import Employee, EmployeeTable
+from ..utils.constants import DEPARTMENTS, EXCEL_FILENAME, EMPLOYEES_SHEET_NAME, SUMMARY_SHEET_NAME
 
-from models.employee import Employee
-from utils.constants import EXCEL_FILENAME, EMPLOYEES_SHEET_NAME, SUMMARY_SHEET_NAME
+EMPLOYEE_COLUMNS = ['emp_id', 'full_name', 'department', 'salary', 'hire_date']
 
 class ExcelExporter:
     """
@@ -33,25 +32,29 @@ class ExcelExporter:
     def __init__(self):
         logging.info("Initializing ExcelExporter")
 
-    def _employees_to_dataframe(self, employees: List[Employee]) -> pd.DataFrame:
+    def _employees_to_dataframe(self, employees: Union[EmployeeTable, List[Employee]]) -> pd.DataFrame:
         """
-        Convert list of Employee objects to pandas DataFrame.
+        Convert employee data to pandas DataFrame.
+
+        An EmployeeTable is converted directly from its column arrays; a
+        list of Employee objects is read as one tuple per row. In both
+        cases the department column is categorical over DEPARTMENTS.
         
         Args:
-            employees: List of Employee objects
+            employees: EmployeeTable or list of Employee objects
             
         Returns:
             pd.DataFrame: DataFrame with employee data
         """
         try:
-            # Convert each employee to dictionary using the to_dict method
-            data = [emp.to_dict() for emp in employees]
-            
-            # Create DataFrame
-            df = pd.DataFrame(data)
-            
-            # Ensure proper column order
-            df = df[['emp_id', 'full_name', 'department', 'salary', 'hire_date']]
+            if isinstance(employees, EmployeeTable):
+                df = employees.to_dataframe()
+            else:
+                # Columns come out of attrgetter already in export order
+                getter = attrgetter(*EMPLOYEE_COLUMNS)
+                df = pd.DataFrame.from_records(map(getter, employees), columns=EMPLOYEE_COLUMNS)
+                # Same categories as the table path so summaries agree
+                df['department'] = pd.Categorical(df['department'], categories=DEPARTMENTS)
             
             logging.debug(f"Created DataFrame with {len(df)} rows")
             return df
@@ -60,38 +63,26 @@ class ExcelExporter:
             logging.error(f"Error converting employees to DataFrame: {e}")
             raise
     
-    def _create_summary_data(self, employees: List[Employee]) -> pd.DataFrame:
+    def _create_summary_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Create summary statistics showing average salary per department.
         
         Args:
-            employees: List of Employee objects
+            df: Employees DataFrame as built by _employees_to_dataframe
             
         Returns:
             pd.DataFrame: Summary DataFrame with department averages
         """
         try:
-            # Convert to DataFrame first
-            df = self._employees_to_dataframe(employees)
-            
-            # Group by department and calculate average salary
-            summary = df.groupby('department')['salary'].agg(['mean', 'count']).round(2)
+            # Group by department category codes and calculate average salary
+            summary = df.groupby('department', observed=False, sort=True)['salary'].agg(['mean', 'count'])
             summary = summary.rename(columns={'mean': 'avg_salary', 'count': 'employee_count'})
+            summary['avg_salary'] = summary['avg_salary'].round(2)
             summary = summary.reset_index()
             
-            # Sort by department name
-            summary = summary.sort_values('department')
-            
-            # Add export timestamp
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            timestamp_row = pd.DataFrame({
-                'department': ['Export Timestamp'],
-                'avg_salary': [pd.NA],
-                'employee_count': [timestamp]
-            })
-
-            # Combine summary with timestamp
-            summary = pd.concat([summary, timestamp_row], ignore_index=True)
+            # Sort by department name rather than category order
+            summary['department'] = summary['department'].astype(str)
+            summary = summary.sort_values('department', ignore_index=True)
             
             logging.debug("Created summary data")
             return summary
@@ -99,14 +90,46 @@ class ExcelExporter:
         except Exception as e:
             logging.error(f"Error creating summary data: {e}")
             raise
+
+    def _write_summary_sheet(self, writer: pd.ExcelWriter, summary: pd.DataFrame) -> None:
+        """
+        Write the summary sheet directly through the xlsxwriter worksheet API.
+
+        The summary has only a handful of rows, so its cells are written
+        as-is rather than going through DataFrame.to_excel. The export
+        timestamp is written as a labeled row below the department rows
+        and also stored in the workbook's comments property.
+        
+        Args:
+            writer: Open ExcelWriter using the xlsxwriter engine
+            summary: Summary DataFrame from _create_summary_data
+        """
+        worksheet = writer.book.add_worksheet(SUMMARY_SHEET_NAME)
+        header_format = writer.book.add_format({'bold': True, 'border': 1})
+        worksheet.write_row(0, 0, list(summary.columns), header_format)
+
+        row = 0
+        for row, (department, avg_salary, employee_count) in enumerate(
+                summary.itertuples(index=False), start=1):
+            # Departments without employees have no average; leave the cell blank
+            if pd.isna(avg_salary):
+                avg_salary = None
+            worksheet.write_row(row, 0, [department, avg_salary, employee_count])
+
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        worksheet.write_row(row + 1, 0, ['Export Timestamp', None, timestamp])
+        writer.book.set_properties({'comments': f"Export Timestamp: {timestamp}"})
     
-    def export_to_excel(self, employees: List[Employee], folder_path: str) -> str:
+    def export_to_excel(self, employees: Union[EmployeeTable, List[Employee]], folder_path: str,
+                        progress_callback: Optional[Callable[[int], None]] = None) -> str:
         """
         Export employee data to Excel file with two sheets.
         
         Args:
-            employees: List of Employee objects to export
+            employees: EmployeeTable or list of Employee objects to export
             folder_path: Directory path where to save the Excel file
+            progress_callback: Optional callable receiving the completed
+                percentage (0-100) after each export stage
             
         Returns:
             str: Full path to the created Excel file
@@ -123,12 +146,19 @@ class ExcelExporter:
             
             logging.info(f"Starting Excel export to: {file_path}")
             
-            # Create DataFrames
+            # Create DataFrames; the employees frame is built once and reused
+            # for the summary
             employees_df = self._employees_to_dataframe(employees)
-            summary_df = self._create_summary_data(employees)
+            summary_df = self._create_summary_data(employees_df)
+            if progress_callback:
+                progress_callback(25)
             
-            # Create Excel writer
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+            # Write hire dates as native Excel dates via the writer's datetime_format
+            employees_df['hire_date'] = pd.to_datetime(employees_df['hire_date'])
+
+            # Create Excel writer. xlsxwriter's constant_memory mode is not used:
+            # pandas emits cells column by column, which that mode cannot accept.
+            with pd.ExcelWriter(file_path, engine='xlsxwriter', datetime_format='yyyy-mm-dd') as writer:
                 # Write Employees sheet
                 employees_df.to_excel(
                     writer, 
@@ -136,15 +166,17 @@ class ExcelExporter:
                     index=False,
                     startrow=0
                 )
+                if progress_callback:
+                    progress_callback(50)
                 
                 # Write Summary sheet
-                summary_df.to_excel(
-                    writer, 
-                    sheet_name=SUMMARY_SHEET_NAME, 
-                    index=False,
-                    startrow=0
-                )
+                self._write_summary_sheet(writer, summary_df)
+                if progress_callback:
+                    progress_callback(75)
             
+            if progress_callback:
+                progress_callback(100)
+
             logging.info(f"Successfully exported {len(employees)} employees to {file_path}")
             return file_path
             
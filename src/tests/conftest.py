@@ -0,0 +1,14 @@
+"""
+Shared test fixtures.
+
+"""
+
+import pytest
+
+from src.services.data_gen import EmployeeDataGenerator
+
+
+@pytest.fixture(scope='module')
+def generator():
+    """Shared generator; Faker initialization is too slow to repeat per test."""
+    return EmployeeDataGenerator()
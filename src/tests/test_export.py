@@ -0,0 +1,100 @@
+"""
+Unit Tests for Excel Export Service
+
+This module contains unit tests for the Excel export functionality.
+Tests cover DataFrame conversion, summary statistics, and the written workbook.
+
+Run with: python -m pytest src/tests/test_export.py -v
+
+"""
+
+import os
+import pytest
+import openpyxl
+import pandas as pd
+from datetime import date
+
+from src.models.employee import Employee
+from src.services.excel_export import ExcelExporter
+from src.utils.constants import DEPARTMENTS, EMPLOYEES_SHEET_NAME, SUMMARY_SHEET_NAME
+
+
+class TestExcelExporter:
+    """Test cases for ExcelExporter class."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.exporter = ExcelExporter()
+
+    def test_employees_to_dataframe_from_list(self):
+        """Test DataFrame conversion from a list of Employee objects."""
+        employees = [
+            Employee(1, "John Doe", "IT", 75000.50, date(2023, 1, 15)),
+            Employee(2, "Jane Roe", "HR", 50000.00, date(2021, 6, 1)),
+        ]
+        df = self.exporter._employees_to_dataframe(employees)
+
+        assert list(df.columns) == ['emp_id', 'full_name', 'department', 'salary', 'hire_date']
+        assert list(df['emp_id']) == [1, 2]
+        assert list(df['full_name']) == ["John Doe", "Jane Roe"]
+
+    def test_create_summary_data(self):
+        """Test department averages in the summary."""
+        df = pd.DataFrame({
+            'emp_id': [1, 2, 3],
+            'full_name': ["A B", "C D", "E F"],
+            'department': pd.Categorical(["IT", "IT", "HR"]),
+            'salary': [30000.0, 40000.0, 50000.0],
+            'hire_date': [date(2021, 1, 1)] * 3,
+        })
+        summary = self.exporter._create_summary_data(df)
+
+        it_row = summary[summary['department'] == "IT"].iloc[0]
+        assert it_row['avg_salary'] == 35000.0
+        assert it_row['employee_count'] == 2
+        assert list(summary['department']) == ["HR", "IT"]
+
+    def test_summary_lists_every_department(self, generator):
+        """Test that departments without employees still appear in the summary."""
+        table_df = generator.generate_employees(1).to_dataframe()
+        summary = self.exporter._create_summary_data(table_df)
+
+        assert list(summary['department']) == sorted(DEPARTMENTS)
+        assert summary['employee_count'].sum() == 1
+
+    def test_summary_matches_for_table_and_list(self, generator):
+        """Test that a table and the equivalent list produce the same summary."""
+        table = generator.generate_employees(2)
+        table_summary = self.exporter._create_summary_data(self.exporter._employees_to_dataframe(table))
+        list_summary = self.exporter._create_summary_data(self.exporter._employees_to_dataframe(list(table)))
+
+        pd.testing.assert_frame_equal(table_summary, list_summary)
+
+    def test_export_to_excel(self, generator, tmp_path):
+        """Test that export writes both sheets with all employees."""
+        employees = generator.generate_employees(25)
+        file_path = self.exporter.export_to_excel(employees, str(tmp_path))
+
+        assert os.path.exists(file_path)
+        sheets = pd.read_excel(file_path, sheet_name=None)
+        assert set(sheets) == {EMPLOYEES_SHEET_NAME, SUMMARY_SHEET_NAME}
+        assert len(sheets[EMPLOYEES_SHEET_NAME]) == 25
+        assert sheets[EMPLOYEES_SHEET_NAME]['emp_id'].tolist() == list(range(1, 26))
+
+        summary = sheets[SUMMARY_SHEET_NAME]
+        assert list(summary.columns) == ['department', 'avg_salary', 'employee_count']
+        assert summary['department'].iloc[-1] == 'Export Timestamp'
+        assert summary['employee_count'].iloc[:-1].sum() == 25
+
+        workbook = openpyxl.load_workbook(file_path)
+        assert workbook.properties.description.startswith('Export Timestamp: ')
+
+    def test_export_empty_raises(self, tmp_path):
+        """Test that exporting no data raises an error."""
+        with pytest.raises(ValueError):
+            self.exporter.export_to_excel([], str(tmp_path))
+
+
+if __name__ == '__main__':
+    # Run tests if executed directly
+    pytest.main([__file__, '-v'])
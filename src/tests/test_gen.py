@@ -8,48 +8,48 @@ Run with: python -m pytest src/tests/test_gen.py -v
 
 """
 
-import sys
-import os
+import threading
 import pytest
+import numpy as np
+from dataclasses import asdict, FrozenInstanceError
 from datetime import date
 from unittest.mock import patch, MagicMock
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from models.employee import Employee
-from services.data_gen import EmployeeDataGenerator
-from utils.constants import (
+from src.models.employee import Employee, EmployeeTable
+from src.services.data_gen import EmployeeDataGenerator
+from src.utils.constants import (
     DEPARTMENTS, MIN_SALARY, MAX_SALARY,
-    START_DATE, END_DATE, MIN_EMPLOYEES, MAX_EMPLOYEES
+    START_DATE, END_DATE, MIN_EMPLOYEES, MAX_EMPLOYEES, GENERATION_BATCH_SIZE
 )
 
 
+@pytest.fixture
+def seeded_generator():
+    """Fresh generator for tests that reseed it."""
+    return EmployeeDataGenerator()
+
+
 class TestEmployeeDataGenerator:
     """Test cases for EmployeeDataGenerator class."""
 
-    def setup_method(self):
-        """Set up test fixtures before each test method."""
-        self.generator = EmployeeDataGenerator()
-
-    def test_initialization(self):
+    def test_initialization(self, generator):
         """Test that generator initializes correctly."""
-        assert self.generator.fake is not None
-        assert hasattr(self.generator, 'generate_random_date')
-        assert hasattr(self.generator, 'generate_employee')
-        assert hasattr(self.generator, 'generate_employees')
+        assert generator.fake is not None
+        assert hasattr(generator, 'generate_random_date')
+        assert hasattr(generator, 'generate_employee')
+        assert hasattr(generator, 'generate_employees')
 
-    def test_generate_random_date(self):
+    def test_generate_random_date(self, generator):
         """Test random date generation within valid range."""
-        test_date = self.generator.generate_random_date()
+        test_date = generator.generate_random_date()
 
         assert isinstance(test_date, date)
         assert START_DATE <= test_date <= END_DATE
 
-    def test_generate_employee(self):
+    def test_generate_employee(self, generator):
         """Test single employee generation."""
         emp_id = 1
-        employee = self.generator.generate_employee(emp_id)
+        employee = generator.generate_employee(emp_id)
 
         assert isinstance(employee, Employee)
         assert employee.emp_id == emp_id
@@ -59,11 +59,12 @@ class TestEmployeeDataGenerator:
         assert MIN_SALARY <= employee.salary <= MAX_SALARY
         assert START_DATE <= employee.hire_date <= END_DATE
 
-    def test_generate_employees(self):
+    def test_generate_employees(self, generator):
         """Test bulk employee generation."""
         count = 5
-        employees = self.generator.generate_employees(count)
+        employees = generator.generate_employees(count)
 
+        assert isinstance(employees, EmployeeTable)
         assert len(employees) == count
         assert all(isinstance(emp, Employee) for emp in employees)
 
@@ -71,18 +72,44 @@ class TestEmployeeDataGenerator:
         ids = [emp.emp_id for emp in employees]
         assert ids == list(range(1, count + 1))
 
-    def test_generate_employees_large_count(self):
+    def test_generate_employees_large_count(self, generator):
         """Test generation with maximum allowed count."""
         count = 100
-        employees = self.generator.generate_employees(count)
+        employees = generator.generate_employees(count)
 
         assert len(employees) == count
         assert all(emp.emp_id == i + 1 for i, emp in enumerate(employees))
 
-    def test_employee_data_variety(self):
+    def test_progress_callback(self, generator):
+        """Test that progress is reported after each batch of names."""
+        reported = []
+        generator.generate_employees(GENERATION_BATCH_SIZE * 2 + 1, progress_callback=reported.append)
+
+        assert reported == [GENERATION_BATCH_SIZE, GENERATION_BATCH_SIZE * 2, GENERATION_BATCH_SIZE * 2 + 1]
+
+    def test_cancel_event(self, generator):
+        """Test that a set cancel event stops generation and returns None."""
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        assert generator.generate_employees(10, cancel_event=cancel_event) is None
+
+    def test_seed_reproducible(self, seeded_generator):
+        """Test that seeding makes generation reproducible."""
+        other = EmployeeDataGenerator()
+        seeded_generator.seed(42)
+        other.seed(42)
+
+        first = list(seeded_generator.generate_employees(10))
+        second = list(other.generate_employees(10))
+        assert first == second
+        assert seeded_generator.generate_employee(1) == other.generate_employee(1)
+
+    def test_employee_data_variety(self, seeded_generator):
         """Test that generated data has variety."""
         count = 50
-        employees = self.generator.generate_employees(count)
+        seeded_generator.seed(1234)
+        employees = seeded_generator.generate_employees(count)
 
         # Check that we get different names
         names = [emp.full_name for emp in employees]
@@ -92,10 +119,10 @@ class TestEmployeeDataGenerator:
         departments = [emp.department for emp in employees]
         assert len(set(departments)) > 1  # Multiple departments used
 
-    def test_salary_range(self):
+    def test_salary_range(self, generator):
         """Test that salaries are within specified range."""
         count = 20
-        employees = self.generator.generate_employees(count)
+        employees = generator.generate_employees(count)
 
         salaries = [emp.salary for emp in employees]
         assert all(MIN_SALARY <= salary <= MAX_SALARY for salary in salaries)
@@ -103,14 +130,21 @@ class TestEmployeeDataGenerator:
         # Check salary precision (should be rounded to 2 decimal places)
         assert all(salary == round(salary, 2) for salary in salaries)
 
-    def test_hire_date_range(self):
+    def test_hire_date_range(self, generator):
         """Test that hire dates are within specified range."""
         count = 20
-        employees = self.generator.generate_employees(count)
+        employees = generator.generate_employees(count)
 
         hire_dates = [emp.hire_date for emp in employees]
         assert all(START_DATE <= hire_date <= END_DATE for hire_date in hire_dates)
 
+    def test_hire_dates_follow_ids(self, generator):
+        """Test that hire dates are ordered by employee ID."""
+        employees = generator.generate_employees(50)
+
+        hire_dates = [emp.hire_date for emp in employees]
+        assert hire_dates == sorted(hire_dates)
+
 
 class TestEmployeeModel:
     """Test cases for Employee dataclass."""
@@ -131,8 +165,8 @@ class TestEmployeeModel:
         assert emp.salary == 75000.50
         assert emp.hire_date == date(2023, 1, 15)
 
-    def test_employee_to_dict(self):
-        """Test Employee to_dict conversion."""
+    def test_employee_asdict(self):
+        """Test Employee conversion with dataclasses.asdict."""
         emp = Employee(
             emp_id=1,
             full_name="John Doe",
@@ -141,7 +175,7 @@ class TestEmployeeModel:
             hire_date=date(2023, 1, 15)
         )
 
-        data = emp.to_dict()
+        data = asdict(emp)
         expected = {
             'emp_id': 1,
             'full_name': "John Doe",
@@ -152,20 +186,68 @@ class TestEmployeeModel:
 
         assert data == expected
 
+    def test_employee_is_immutable(self):
+        """Test that Employee fields cannot be reassigned."""
+        emp = Employee(1, "John Doe", "IT", 75000.50, date(2023, 1, 15))
+
+        with pytest.raises(FrozenInstanceError):
+            emp.salary = 1.0
+        assert not hasattr(emp, '__dict__')
+
+
+class TestEmployeeTable:
+    """Test cases for EmployeeTable columnar store."""
+
+    def _make_table(self):
+        return EmployeeTable(
+            emp_id=np.array([1, 2], dtype=np.int64),
+            names=["John Doe", "Jane Roe"],
+            dept_idx=np.array([0, 4], dtype=np.int32),
+            salary=np.array([75000.50, 30000.00]),
+            hire_date_offset=np.array([0, 31], dtype=np.int32)
+        )
+
+    def test_getitem_builds_employee(self):
+        """Test that indexing a table yields an Employee record."""
+        table = self._make_table()
+        emp = table[1]
+
+        assert isinstance(emp, Employee)
+        assert emp.emp_id == 2
+        assert emp.full_name == "Jane Roe"
+        assert emp.department == DEPARTMENTS[4]
+        assert emp.salary == 30000.00
+        assert emp.hire_date == date(2020, 2, 1)
+
+    def test_to_dataframe(self):
+        """Test DataFrame conversion of a table."""
+        df = self._make_table().to_dataframe()
+
+        assert list(df.columns) == ['emp_id', 'full_name', 'department', 'salary', 'hire_date']
+        assert len(df) == 2
+        assert list(df['department']) == [DEPARTMENTS[0], DEPARTMENTS[4]]
+        assert df['hire_date'].iloc[0].date() == START_DATE
+
+    def test_hire_date_storage(self):
+        """Test that hire dates are stored as int32 offsets from START_DATE."""
+        table = self._make_table()
+
+        assert table.hire_date_offset.dtype == np.int32
+        assert [d.date() for d in table.hire_date_array] == [START_DATE, date(2020, 2, 1)]
+
 
 class TestIntegration:
     """Integration tests combining multiple components."""
 
-    def test_full_workflow(self):
+    def test_full_workflow(self, generator):
         """Test complete data generation workflow."""
-        generator = EmployeeDataGenerator()
         employees = generator.generate_employees(10)
 
         assert len(employees) == 10
 
         # Test that all employees can be converted to dict
         for emp in employees:
-            data = emp.to_dict()
+            data = asdict(emp)
             assert isinstance(data, dict)
             assert 'emp_id' in data
             assert 'full_name' in data
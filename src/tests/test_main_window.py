@@ -0,0 +1,78 @@
+"""
+Unit Tests for the Main Window
+
+This module contains unit tests for input handling in the main window.
+Tests run Qt with the offscreen platform, so no display is needed.
+
+Run with: python -m pytest src/tests/test_main_window.py -v
+
+"""
+
+import os
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QLocale, QThreadPool
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from src.ui.main_window import MainWindow
+
+
+@pytest.fixture(scope='module')
+def app():
+    """Single QApplication for the module."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(app):
+    """Main window; waits for any background task it started."""
+    window = MainWindow()
+    yield window
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+
+class TestEmployeeCountInput:
+    """Test cases for employee count validation and parsing."""
+
+    def test_group_separator_accepted(self, window, monkeypatch):
+        """Test that a count typed with a group separator is parsed."""
+        warnings = []
+        monkeypatch.setattr(QMessageBox, 'warning', lambda *args: warnings.append(args))
+        window._count_validator.setLocale(QLocale.c())
+        window.employee_count_input.setText("1,000")
+
+        window._generate_data()
+
+        assert warnings == []
+        assert window._generate_task.count == 1000
+
+    def test_unparseable_input_warns(self, window, monkeypatch):
+        """Test that input the validator accepts but cannot parse shows a warning."""
+        warnings = []
+        monkeypatch.setattr(QMessageBox, 'warning', lambda *args: warnings.append(args))
+        monkeypatch.setattr(window.employee_count_input, 'hasAcceptableInput', lambda: True)
+        window.employee_count_input.setText("1;000")
+
+        window._generate_data()
+
+        assert len(warnings) == 1
+        assert window._generate_task is None
+
+    def test_invalid_input_warns(self, window, monkeypatch):
+        """Test that invalid input shows a warning instead of generating."""
+        warnings = []
+        monkeypatch.setattr(QMessageBox, 'warning', lambda *args: warnings.append(args))
+        window.employee_count_input.setText("abc")
+
+        window._generate_data()
+
+        assert len(warnings) == 1
+        assert window._generate_task is None
+
+
+if __name__ == '__main__':
+    # Run tests if executed directly
+    pytest.main([__file__, '-v'])
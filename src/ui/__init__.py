@@ -0,0 +1 @@
+"""PySide6 user interface: main window and background workers."""
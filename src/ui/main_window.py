@@ -9,18 +9,100 @@ Features:
 - Folder selection for Excel export location
 - Buttons for data generation and export
 - Status display for user feedback
+- Background data generation and Excel export, with a progress bar
 
 """
 
 import logging
+import os
+import threading
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QLineEdit, QPushButton, QFileDialog, QMessageBox
+    QLineEdit, QPushButton, QFileDialog, QMessageBox, QProgressBar
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QPalette, QColor
-from utils.constants import DEFAULT_EMPLOYEE_COUNT
-import os
+from PySide6.QtCore import Qt, QThreadPool, QTimer
+from PySide6.QtGui import QFont, QIntValidator
+from ..utils.constants import DEFAULT_EMPLOYEE_COUNT, MIN_EMPLOYEES, MAX_EMPLOYEES
+from ..services.data_gen import EmployeeDataGenerator
+from ..services.excel_export import ExcelExporter
+from .workers import ExportRunnable, GenerateRunnable
+
+# Stylesheet for the whole window, parsed once when the UI is built. Widgets
+# are matched by object name; the status label's error look is selected
+# through its "state" dynamic property.
+_COMBINED_QSS = """
+    QLabel#folderPathLabel {
+        border: 1px solid #ccc;
+        padding: 5px;
+        background-color: #f9f9f9;
+    }
+    QPushButton#generateButton, QPushButton#exportButton {
+        color: white;
+        padding: 8px 16px;
+        border: none;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton#generateButton {
+        background-color: #4CAF50;
+    }
+    QPushButton#generateButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton#exportButton {
+        background-color: #2196F3;
+    }
+    QPushButton#exportButton:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#generateButton:disabled, QPushButton#exportButton:disabled {
+        background-color: #cccccc;
+    }
+    QLabel#statusTitle {
+        font-weight: bold;
+    }
+    QLabel#statusLabel {
+        border: 1px solid #ddd;
+        padding: 10px;
+        background-color: #f0f8ff;
+        border-radius: 4px;
+        min-height: 20px;
+        color: #000000;
+    }
+    QLabel#statusLabel[state="error"] {
+        border: 1px solid #ff6b6b;
+        background-color: #ffebee;
+        color: #c62828;
+    }
+"""
+
+# Single validation message for any empty, non-numeric or out-of-range count
+_MSG_COUNT_RANGE = f"Please enter a number between {MIN_EMPLOYEES} and {MAX_EMPLOYEES}."
+
+# Status message templates, filled with % formatting on each update
+_MSG_GEN_PROGRESS = "Generating employee data... %d%%"
+_MSG_GEN_OK = "Successfully generated %d employees"
+_MSG_EXPORT_OK = "File '%s' exported successfully!"
+
+_title_font_cache = None
+
+
+def _title_font():
+    """
+    Return the shared bold title font, creating it on first use.
+
+    QFont needs a running QGuiApplication, so it cannot be built at import.
+
+    Returns:
+        QFont: 14pt bold font for the window title
+    """
+    global _title_font_cache
+    if _title_font_cache is None:
+        _title_font_cache = QFont()
+        _title_font_cache.setPointSize(14)
+        _title_font_cache.setBold(True)
+    return _title_font_cache
+
 
 class MainWindow(QMainWindow):
     """
@@ -36,11 +118,13 @@ class MainWindow(QMainWindow):
         employee_count_input (QLineEdit): Input field for number of employees
         folder_path_label (QLabel): Display for selected folder path
         status_label (QLabel): Status message display
+        progress_bar (QProgressBar): Progress of a running generation or export
         generate_button (QPushButton): Button to generate employee data
         export_button (QPushButton): Button to export data to Excel
+        cancel_button (QPushButton): Button to stop a running generation
         select_folder_button (QPushButton): Button to choose export folder
         selected_folder (str): Currently selected folder path for export
-        employee_data (list): Generated employee data (Employee objects)
+        employee_data (EmployeeTable): Generated employee data
     """
 
     def __init__(self):
@@ -53,6 +137,26 @@ class MainWindow(QMainWindow):
         # Initialize data storage
         self.selected_folder = ""
         self.employee_data = []
+        self._generate_task = None
+        self._cancel_flag = threading.Event()
+        self._status_is_error = False
+        self._export_task = None
+
+        # Status updates are coalesced and painted at most every 50 ms
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._flush_status)
+
+        # Services are created once and reused; Faker setup is costly
+        self._generator = EmployeeDataGenerator()
+        self._exporter = ExcelExporter()
+
+        # Folder dialog is configured once and reused on every selection
+        self._folder_dialog = QFileDialog(self, "Select Export Folder")
+        self._folder_dialog.setFileMode(QFileDialog.Directory)
+        self._folder_dialog.setOption(QFileDialog.ShowDirsOnly)
 
         # Set up window properties
         self.setWindowTitle("Employee Data Generator")
@@ -76,6 +180,10 @@ class MainWindow(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
 
+        # Hold repaints until every widget is in place, so layout and
+        # painting happen in one pass instead of once per added widget
+        central_widget.setUpdatesEnabled(False)
+
         # Main vertical layout
         main_layout = QVBoxLayout(central_widget)
         main_layout.setSpacing(15)
@@ -83,10 +191,7 @@ class MainWindow(QMainWindow):
 
         # Title
         title_label = QLabel("Employee Data Generator")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_title_font())
         title_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(title_label)
 
@@ -95,7 +200,10 @@ class MainWindow(QMainWindow):
         count_label = QLabel("Number of Employees:")
         count_label.setMinimumWidth(150)
         self.employee_count_input = QLineEdit()
-        self.employee_count_input.setPlaceholderText("Enter number (1-1000)")
+        self.employee_count_input.setPlaceholderText(f"Enter number ({MIN_EMPLOYEES}-{MAX_EMPLOYEES})")
+        # Reject non-numeric keystrokes up front; range is checked on click
+        self._count_validator = QIntValidator(MIN_EMPLOYEES, MAX_EMPLOYEES, self)
+        self.employee_count_input.setValidator(self._count_validator)
         self.employee_count_input.setMaximumWidth(200)
         count_layout.addWidget(count_label)
         count_layout.addWidget(self.employee_count_input)
@@ -107,7 +215,7 @@ class MainWindow(QMainWindow):
         folder_label = QLabel("Export Folder:")
         folder_label.setMinimumWidth(150)
         self.folder_path_label = QLabel("No folder selected")
-        self.folder_path_label.setStyleSheet("border: 1px solid #ccc; padding: 5px; background-color: #f9f9f9;")
+        self.folder_path_label.setObjectName("folderPathLabel")
         self.select_folder_button = QPushButton("Select Folder")
         self.select_folder_button.setMaximumWidth(100)
         folder_layout.addWidget(folder_label)
@@ -121,75 +229,53 @@ class MainWindow(QMainWindow):
 
         self.generate_button = QPushButton("Generate Data")
         self.generate_button.setMinimumWidth(120)
-        self.generate_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.generate_button.setObjectName("generateButton")
 
         self.export_button = QPushButton("Export to Excel")
         self.export_button.setMinimumWidth(120)
         self.export_button.setEnabled(False)  # Initially disabled
-        self.export_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.export_button.setObjectName("exportButton")
+
+        # Shown only while a generation is running
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setMinimumWidth(120)
+        self.cancel_button.setVisible(False)
 
         buttons_layout.addWidget(self.generate_button)
         buttons_layout.addWidget(self.export_button)
+        buttons_layout.addWidget(self.cancel_button)
         buttons_layout.addStretch()
         main_layout.addLayout(buttons_layout)
 
         # Status display section
         status_title = QLabel("Status:")
-        status_title.setStyleSheet("font-weight: bold;")
+        status_title.setObjectName("statusTitle")
         main_layout.addWidget(status_title)
 
         self.status_label = QLabel("Ready to generate employee data")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                border: 1px solid #ddd;
-                padding: 10px;
-                background-color: #f0f8ff;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-        """)
+        self.status_label.setObjectName("statusLabel")
+        self.status_label.setProperty("state", "ok")
         self.status_label.setWordWrap(True)
         main_layout.addWidget(self.status_label)
 
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setVisible(False)
+        main_layout.addWidget(self.progress_bar)
+
         # Add stretch to push everything to the top
         main_layout.addStretch()
 
+        self.setStyleSheet(_COMBINED_QSS)
+        central_widget.setUpdatesEnabled(True)
+
     def _connect_signals(self):
         """
         Connect UI signals to their respective slot methods.
         """
         self.select_folder_button.clicked.connect(self._select_folder)
         self.generate_button.clicked.connect(self._generate_data)
+        self.cancel_button.clicked.connect(self._cancel_generation)
         self.export_button.clicked.connect(self._export_to_excel)
 
     def _select_folder(self):
@@ -197,16 +283,14 @@ class MainWindow(QMainWindow):
         Open a folder selection dialog and update the selected folder path.
         """
         try:
-            folder = QFileDialog.getExistingDirectory(
-                self,
-                "Select Export Folder",
-                self.selected_folder or ""
-            )
+            self._folder_dialog.setDirectory(self.selected_folder or "")
+            folder = ""
+            if self._folder_dialog.exec():
+                folder = self._folder_dialog.selectedFiles()[0]
 
             if folder:
                 self.selected_folder = folder
                 # Display only the folder name for brevity
-                import os
                 folder_name = os.path.basename(folder)
                 self.folder_path_label.setText(f"{folder_name}/")
                 self.folder_path_label.setToolTip(folder)  # Full path as tooltip
@@ -226,44 +310,103 @@ class MainWindow(QMainWindow):
         """
         Generate employee data based on user input.
         """
+        # Validate and parse the employee count with the validator's locale,
+        # which accepts group separators such as "1,000" that int() rejects.
+        # Any invalid input exits with one warning before other work.
+        count, parsed = self._count_validator.locale().toInt(self.employee_count_input.text())
+        if not (parsed and self.employee_count_input.hasAcceptableInput()):
+            QMessageBox.warning(self, "Input Error", _MSG_COUNT_RANGE)
+            return
+
         try:
-            # Get and validate employee count
-            count_text = self.employee_count_input.text().strip()
-            
-            if not count_text:
-                QMessageBox.warning(self, "Input Error", "Please enter the number of employees to generate.")
-                return
-
-            try:
-                count = int(count_text)
-                if count < 1 or count > 1000:
-                    QMessageBox.warning(self, "Input Error", "Please enter a number between 1 and 1000.")
-                    return
-            except ValueError:
-                QMessageBox.warning(self, "Input Error", "Please enter a valid number.")
-                return
-
-            # Import and use data generator
-            from services.data_gen import EmployeeDataGenerator
-            
-            # Generate data
+            # Generate data on the thread pool; results arrive via signals
             self._update_status("Generating employee data...")
-            generator = EmployeeDataGenerator()
-            self.employee_data = generator.generate_employees(count)
-            
-            # Update UI
-            self._update_status(f"Successfully generated {count} employees")
-            
-            # Enable export button if folder is selected
-            if self.selected_folder:
-                self.export_button.setEnabled(True)
-
-            logging.info(f"Data generation completed for {count} employees")
+            self._cancel_flag.clear()
+            self.progress_bar.setValue(0)
+            self._set_generation_running(True)
+            self._generate_task = GenerateRunnable(self._generator, count, self._cancel_flag)
+            self._generate_task.signals.progress.connect(self._on_generation_progress)
+            self._generate_task.signals.finished.connect(self._on_generated)
+            self._generate_task.signals.error.connect(self._on_generation_error)
+            self._generate_task.signals.cancelled.connect(self._on_generation_cancelled)
+            QThreadPool.globalInstance().start(self._generate_task)
 
         except Exception as e:
-            logging.error(f"Error in data generation: {e}")
-            self._update_status("Error generating data", error=True)
-            QMessageBox.critical(self, "Generation Error", f"Failed to generate employee data:\n{str(e)}")
+            self._on_generation_error(str(e))
+
+    def _on_generation_progress(self, percent):
+        """
+        Show the progress of a running generation.
+
+        Args:
+            percent (int): Completed percentage
+        """
+        self.progress_bar.setValue(percent)
+        self._update_status(_MSG_GEN_PROGRESS % percent)
+
+    def _on_generated(self, employees):
+        """
+        Store data produced by a completed background generation.
+
+        Args:
+            employees (EmployeeTable): Generated employee data
+        """
+        self.employee_data = employees
+        self._set_generation_running(False)
+
+        # Update UI
+        self._update_status(_MSG_GEN_OK % len(employees))
+
+        logging.info(f"Data generation completed for {len(employees)} employees")
+
+    def _on_generation_error(self, message):
+        """
+        Handle a failed data generation.
+
+        Args:
+            message (str): Error description
+        """
+        logging.error(f"Error in data generation: {message}")
+        self._set_generation_running(False)
+        self._update_status("Error generating data", error=True)
+        QMessageBox.critical(self, "Generation Error", f"Failed to generate employee data:\n{message}")
+
+    def _cancel_generation(self):
+        """
+        Ask the running generation to stop at its next batch boundary.
+        """
+        self._cancel_flag.set()
+        self.cancel_button.setEnabled(False)
+        self._update_status("Cancelling generation...")
+
+    def _on_generation_cancelled(self):
+        """
+        Handle a generation stopped by the user; partial data is discarded.
+        """
+        self._set_generation_running(False)
+        self._update_status("Generation cancelled")
+        logging.info("Data generation cancelled by user")
+
+    def _set_generation_running(self, running):
+        """
+        Toggle controls while a background generation is running.
+
+        Export and folder selection are blocked until the new data is
+        ready; afterwards export is enabled again if there is data and an
+        export folder.
+
+        Args:
+            running (bool): Whether a generation is in progress
+        """
+        self.progress_bar.setVisible(running)
+        self.generate_button.setEnabled(not running)
+        # Picking a folder would re-enable Export for the stale data
+        self.select_folder_button.setEnabled(not running)
+        self.cancel_button.setVisible(running)
+        self.cancel_button.setEnabled(running)
+        self.export_button.setEnabled(
+            not running and bool(self.employee_data) and bool(self.selected_folder)
+        )
 
     def _export_to_excel(self):
         """
@@ -278,67 +421,107 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            # Import and use Excel exporter
-            from services.excel_export import ExcelExporter
-            
             # Update status
             self._update_status("Exporting to Excel...")
+            self.progress_bar.setValue(0)
+            self._set_export_running(True)
             
-            # Create exporter and export
-            exporter = ExcelExporter()
-            file_path = exporter.export_to_excel(self.employee_data, self.selected_folder)
-            
-            # Update status with success message
-            file_name = os.path.basename(file_path)
-            self._update_status(f"File '{file_name}' exported successfully!")
-            
-            # Show success message
-            QMessageBox.information(
-                self, 
-                "Export Complete", 
-                f"Employee data has been exported to:\n{file_path}\n\nGenerated {len(self.employee_data)} employee records."
-            )
-            
-            logging.info(f"Excel export completed: {file_path}")
+            # Run the export on the thread pool; results arrive via signals
+            self._export_task = ExportRunnable(self._exporter, self.employee_data, self.selected_folder)
+            self._export_task.signals.progress.connect(self.progress_bar.setValue)
+            self._export_task.signals.finished.connect(self._on_export_finished)
+            self._export_task.signals.error.connect(self._on_export_error)
+            QThreadPool.globalInstance().start(self._export_task)
 
         except Exception as e:
-            logging.error(f"Error in Excel export: {e}")
-            self._update_status("Export failed", error=True)
-            QMessageBox.critical(
-                self, 
-                "Export Error", 
-                f"Failed to export data to Excel:\n{str(e)}"
-            )
+            self._on_export_error(str(e))
+
+    def _on_export_finished(self, file_path):
+        """
+        Handle a completed background export.
+
+        Args:
+            file_path (str): Path of the written Excel file
+        """
+        self._set_export_running(False)
+
+        # Update status with success message
+        file_name = os.path.basename(file_path)
+        self._update_status(_MSG_EXPORT_OK % file_name)
+        
+        # Show success message
+        QMessageBox.information(
+            self, 
+            "Export Complete", 
+            f"Employee data has been exported to:\n{file_path}\n\nGenerated {len(self.employee_data)} employee records."
+        )
+        
+        logging.info(f"Excel export completed: {file_path}")
+
+    def _on_export_error(self, message):
+        """
+        Handle a failed export.
+
+        Args:
+            message (str): Error description
+        """
+        logging.error(f"Error in Excel export: {message}")
+        self._set_export_running(False)
+        self._update_status("Export failed", error=True)
+        QMessageBox.critical(
+            self, 
+            "Export Error", 
+            f"Failed to export data to Excel:\n{message}"
+        )
+
+    def _set_export_running(self, running):
+        """
+        Toggle controls while a background export is writing the file.
+
+        Generation, export and folder selection are blocked during the
+        write so the data being exported cannot be replaced or written
+        twice.
+
+        Args:
+            running (bool): Whether an export is in progress
+        """
+        self.progress_bar.setVisible(running)
+        self.generate_button.setEnabled(not running)
+        self.export_button.setEnabled(not running)
+        # Picking a folder would re-enable Export mid-write
+        self.select_folder_button.setEnabled(not running)
 
     def _update_status(self, message, error=False):
         """
-        Update the status label with a message.
+        Queue a status message for display.
+
+        Bursts of updates, such as generation progress, are coalesced:
+        only the latest message is shown when the debounce timer fires.
 
         Args:
             message (str): Status message to display
             error (bool): Whether this is an error message
         """
+        self._pending_status = (message, error)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        """
+        Show the latest queued status message on the status label.
+        """
+        if self._pending_status is None:
+            return
+        message, error = self._pending_status
+        self._pending_status = None
+
         self.status_label.setText(message)
 
-        if error:
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    border: 1px solid #ff6b6b;
-                    padding: 10px;
-                    background-color: #ffebee;
-                    border-radius: 4px;
-                    min-height: 20px;
-                    color: #c62828;
-                }
-            """)
-        else:
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    border: 1px solid #ddd;
-                    padding: 10px;
-                    background-color: #f0f8ff;
-                    border-radius: 4px;
-                    min-height: 20px;
-                    color: #000000;
-                }
-            """)
\ No newline at end of file
+        # Most updates keep the current look; only re-polish when it flips
+        if error == self._status_is_error:
+            return
+        self._status_is_error = error
+
+        # Restyle through the dynamic property; the stylesheet is not re-parsed
+        self.status_label.setProperty("state", "error" if error else "ok")
+        self.status_label.style().polish(self.status_label)
@@ -0,0 +1,112 @@
+"""
+Background Workers
+
+This module contains QRunnable tasks that run long operations on the
+global QThreadPool, so the Qt event loop stays responsive while they work.
+
+Each task reports back through a WorkerSignals object whose signals are
+delivered to slots on the main thread.
+
+"""
+
+import logging
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by a background task.
+
+    Attributes:
+        progress (Signal): Completed percentage (0-100)
+        finished (Signal): Task result
+        error (Signal): Error message if the task failed
+        cancelled (Signal): Task was stopped before completing
+    """
+
+    progress = Signal(int)
+    finished = Signal(object)
+    error = Signal(str)
+    cancelled = Signal()
+
+
+class GenerateRunnable(QRunnable):
+    """
+    Generates employee data on a worker thread.
+
+    Attributes:
+        signals (WorkerSignals): Emits progress, the generated
+            EmployeeTable on success, cancelled if the cancel event was
+            set, or an error message on failure
+    """
+
+    def __init__(self, generator, count, cancel_event):
+        """
+        Args:
+            generator (EmployeeDataGenerator): Generator to produce the data
+            count (int): Number of employees to generate
+            cancel_event (threading.Event): Set to stop generation early
+        """
+        super().__init__()
+        self.generator = generator
+        self.count = count
+        self.cancel_event = cancel_event
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Generate the data and report the result through the signals."""
+        try:
+            employees = self.generator.generate_employees(
+                self.count,
+                progress_callback=self._report_progress,
+                cancel_event=self.cancel_event
+            )
+        except Exception as e:
+            logging.error(f"Error in background data generation: {e}")
+            self.signals.error.emit(str(e))
+        else:
+            if employees is None:
+                self.signals.cancelled.emit()
+            else:
+                self.signals.finished.emit(employees)
+
+    def _report_progress(self, done):
+        """Emit the completed percentage for the given number of employees."""
+        self.signals.progress.emit(done * 100 // self.count)
+
+
+class ExportRunnable(QRunnable):
+    """
+    Writes employee data to Excel on a worker thread.
+
+    Attributes:
+        signals (WorkerSignals): Emits progress, the exported file path
+            on success, or an error message on failure
+    """
+
+    def __init__(self, exporter, employees, folder_path):
+        """
+        Args:
+            exporter (ExcelExporter): Exporter used to write the workbook
+            employees (EmployeeTable): Employee data to export
+            folder_path (str): Directory to write the Excel file to
+        """
+        super().__init__()
+        self.exporter = exporter
+        self.employees = employees
+        self.folder_path = folder_path
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Export the data and report the result through the signals."""
+        try:
+            file_path = self.exporter.export_to_excel(
+                self.employees,
+                self.folder_path,
+                progress_callback=self.signals.progress.emit
+            )
+        except Exception as e:
+            logging.error(f"Error in background Excel export: {e}")
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(file_path)
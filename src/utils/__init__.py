@@ -0,0 +1 @@
+"""Application constants and helpers."""
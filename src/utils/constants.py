@@ -6,13 +6,17 @@ Centralizing constants here makes them easy to maintain and modify.
 
 """
 
+import sys
 from datetime import date
 
 # Employee data generation constants
-DEPARTMENTS = ["IT", "HR", "Operations", "Administration", "Finance"]
+DEPARTMENTS = tuple(sys.intern(d) for d in ("IT", "HR", "Operations", "Administration", "Finance"))
 """
-List of available departments for employee assignment.
+Tuple of available departments for employee assignment.
 These are the 5 fixed departments as specified in requirements.
+Immutable so the fixed set cannot be changed at runtime. The names are
+interned, so every employee shares the same string objects and dict or
+Counter lookups keyed by department can match on identity.
 """
 
 MIN_SALARY = 25000.0
@@ -35,6 +39,28 @@ END_DATE = date.today()
 End date for random hire date generation (current date).
 """
 
+START_ORDINAL = START_DATE.toordinal()
+"""
+Proleptic Gregorian ordinal of START_DATE. Adding a day offset from
+START_DATE (e.g. EmployeeTable.hire_date_offset) gives the ordinal of
+that date for date.fromordinal.
+"""
+
+END_ORDINAL = END_DATE.toordinal()
+"""
+Proleptic Gregorian ordinal of END_DATE.
+"""
+
+DATE_SPAN_DAYS = END_ORDINAL - START_ORDINAL
+"""
+Number of days between START_DATE and END_DATE, computed once at import.
+"""
+
+GENERATION_BATCH_SIZE = 50
+"""
+Number of employee names generated between progress reports.
+"""
+
 # UI constants
 MAX_EMPLOYEES = 1000
 """